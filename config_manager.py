@@ -29,6 +29,21 @@ class GatewayConfig:
         self.config: Dict = {}
         self._load_config()
         self._validate_config()
+        self._build_permission_index()
+
+    def _build_permission_index(self) -> None:
+        """Precompute (agent, topic) permission pairs for O(1) checks."""
+        allowlist = self.config.get("topic_allowlist", {})
+        self._read_pairs = frozenset(
+            (agent, topic)
+            for agent, perms in allowlist.items()
+            for topic in perms.get("read", [])
+        )
+        self._write_pairs = frozenset(
+            (agent, topic)
+            for agent, perms in allowlist.items()
+            for topic in perms.get("write", [])
+        )
 
     def _load_config(self) -> None:
         """Load configuration from JSON file."""
@@ -106,6 +121,21 @@ class GatewayConfig:
         """Get batch timeout in milliseconds."""
         return self.config.get("performance", {}).get("batch_timeout_ms", 50)
 
+    @property
+    def max_cached_entities(self) -> int:
+        """Get maximum number of cached DDS entities (topics/readers/writers)."""
+        return self.config.get("performance", {}).get("max_cached_entities", 256)
+
+    @property
+    def async_publish(self) -> bool:
+        """Check if low-latency (non-blocking) publication is requested."""
+        return self.config.get("performance", {}).get("async_publish", False)
+
+    @property
+    def write_max_blocking_ms(self) -> int:
+        """Get maximum writer blocking time in milliseconds for async publication."""
+        return self.config.get("performance", {}).get("write_max_blocking_ms", 10)
+
     @property
     def rate_limiting_enabled(self) -> bool:
         """Check if rate limiting is enabled."""
@@ -175,7 +205,7 @@ class GatewayConfig:
         Returns:
             True if agent can read the topic
         """
-        return topic_name in self.get_agent_read_topics(agent_name)
+        return (agent_name, topic_name) in self._read_pairs
 
     def can_agent_write_topic(self, agent_name: str, topic_name: str) -> bool:
         """
@@ -188,7 +218,7 @@ class GatewayConfig:
         Returns:
             True if agent can write to the topic
         """
-        return topic_name in self.get_agent_write_topics(agent_name)
+        return (agent_name, topic_name) in self._write_pairs
 
     def get_all_agents(self) -> List[str]:
         """Get list of all configured agent names."""
@@ -221,6 +251,31 @@ class TypesConfig:
         self.types: Dict = {}
         self._load_types()
 
+    @classmethod
+    def from_bytes(cls, xml_bytes: bytes, types_path: str = "config/types.xml"):
+        """
+        Build a types configuration from in-memory XML bytes.
+
+        Lets callers that already hold the file contents (e.g. tests
+        reading it once) skip the disk read.
+
+        Args:
+            xml_bytes: Raw contents of a types XML file
+            types_path: Path recorded for logging/reference only
+
+        Returns:
+            TypesConfig parsed from the given bytes
+        """
+        config = cls.__new__(cls)
+        config.types_path = Path(types_path)
+        config.types = {}
+        try:
+            config.types = xmltodict.parse(xml_bytes)
+        except Exception as e:
+            raise ConfigurationError(f"Error parsing types XML: {e}")
+        logger.info(f"Loaded DDS types from memory ({config.types_path})")
+        return config
+
     def _load_types(self) -> None:
         """Load DDS type definitions from XML file."""
         try:
@@ -94,13 +94,17 @@ class OllamaChatbot:
         self.fallback_chatbot = SimpleChatbot()
         self.available = False
 
+        # Reuse one session so consecutive generate calls keep the TCP
+        # connection (and any TLS session) to the Ollama server warm.
+        self.session = requests.Session()
+
         # Check if Ollama is available
         self._check_availability()
 
     def _check_availability(self) -> bool:
         """Check if Ollama server is available."""
         try:
-            response = requests.get(f"{self.base_url}/api/tags", timeout=2)
+            response = self.session.get(f"{self.base_url}/api/tags", timeout=2)
             if response.status_code == 200:
                 self.available = True
                 logger.info(f"Ollama server available at {self.base_url}")
@@ -124,7 +128,7 @@ class OllamaChatbot:
             return self.fallback_chatbot.generate_response(prompt)
 
         try:
-            response = requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
@@ -4,6 +4,7 @@ Handles DDS participant creation, topic management, and security integration.
 """
 import logging
 import json
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, List, Optional, Any, Callable
 import asyncio
@@ -23,6 +24,11 @@ try:
     CYCLONE_AVAILABLE = True
 except ImportError:
     CYCLONE_AVAILABLE = False
+    # Placeholders so annotations and module-level references resolve in
+    # mock mode (e.g. when the unit tests import this module)
+    DomainParticipant = Topic = DataWriter = Publisher = None
+    DataReader = Subscriber = Qos = Policy = IdlStruct = duration = None
+    idl_dataclass = dataclass
     logging.warning("Cyclone DDS not available. Running in mock mode.")
 
 from config_manager import GatewayConfig, TypesConfig
@@ -126,7 +132,47 @@ TYPE_MAP = {
 }
 
 
-@dataclass
+class EntityCache(OrderedDict):
+    """
+    Bounded LRU cache for DDS entities (topics, readers, writers).
+
+    Unbounded entity dicts grow with every topic ever touched, which hurts
+    memory and discovery performance on long-running gateways. When the cache
+    exceeds maxsize the least recently used entity is evicted and released.
+    """
+
+    def __init__(self, maxsize: int = 256, name: str = "entity"):
+        """
+        Initialize entity cache.
+
+        Args:
+            maxsize: Maximum number of cached entities
+            name: Entity kind used in eviction log messages
+        """
+        super().__init__()
+        self.maxsize = maxsize
+        self.name = name
+
+    def __getitem__(self, key):
+        value = super().__getitem__(key)
+        self.move_to_end(key)
+        return value
+
+    def get(self, key, default=None):
+        if key in self:
+            return self[key]
+        return default
+
+    def __setitem__(self, key, value):
+        super().__setitem__(key, value)
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            evicted_key, evicted = self.popitem(last=False)
+            logger.info(f"Evicted {self.name} for topic {evicted_key} (cache full)")
+            del evicted
+
+
+@dataclass(slots=True)
 class SubscriptionHandle:
     """Handle for managing DDS subscriptions."""
     topic_name: str
@@ -161,9 +207,10 @@ class CycloneDDSManager:
         self.publisher: Optional[Publisher] = None
         self.subscriber: Optional[Subscriber] = None
 
-        self.topics: Dict[str, Topic] = {}
-        self.data_readers: Dict[str, DataReader] = {}
-        self.data_writers: Dict[str, DataWriter] = {}
+        max_entities = gateway_config.max_cached_entities
+        self.topics: EntityCache = EntityCache(max_entities, name="topic")
+        self.data_readers: EntityCache = EntityCache(max_entities, name="DataReader")
+        self.data_writers: EntityCache = EntityCache(max_entities, name="DataWriter")
         self.subscriptions: Dict[str, SubscriptionHandle] = {}
 
         self._running = False
@@ -440,7 +487,15 @@ class CycloneDDSManager:
         # Reliability
         reliability = qos_config.get("reliability", "RELIABLE")
         if reliability == "RELIABLE":
-            qos += Policy.Reliability.Reliable(duration(seconds=10))
+            if self.gateway_config.async_publish:
+                # Low-latency publication: cap the time write() may block on a
+                # saturated send queue so small-payload topics don't stall the
+                # caller. Cyclone DDS handles the actual send asynchronously.
+                qos += Policy.Reliability.Reliable(
+                    duration(milliseconds=self.gateway_config.write_max_blocking_ms)
+                )
+            else:
+                qos += Policy.Reliability.Reliable(duration(seconds=10))
         else:
             qos += Policy.Reliability.BestEffort
 
@@ -496,9 +551,9 @@ class CycloneDDSManager:
         except Exception as e:
             raise DDSManagerError(f"Failed to read from {topic_name}: {e}")
 
-    async def write_sample(self, topic_name: str, data: Dict) -> None:
+    def _write_sync(self, topic_name: str, data: Dict) -> None:
         """
-        Write a sample to a topic.
+        Serialize and write a sample to a topic (synchronous).
 
         Args:
             topic_name: Name of the topic
@@ -523,6 +578,37 @@ class CycloneDDSManager:
         except Exception as e:
             raise DDSManagerError(f"Failed to write to {topic_name}: {e}")
 
+    async def write_sample(self, topic_name: str, data: Dict) -> None:
+        """
+        Write a sample to a topic.
+
+        Args:
+            topic_name: Name of the topic
+            data: Sample data as dictionary
+
+        Raises:
+            DDSManagerError: If write fails
+        """
+        self._write_sync(topic_name, data)
+
+    def write_nowait(self, topic_name: str, data: Dict) -> None:
+        """
+        Write a sample to a topic without the async wrapper.
+
+        Fire-and-forget path for hot publish loops: skips coroutine creation
+        and event-loop scheduling entirely. Call from outside the event loop,
+        or only with writers whose QoS returns from write() without blocking
+        (see async_publish in the gateway configuration).
+
+        Args:
+            topic_name: Name of the topic
+            data: Sample data as dictionary
+
+        Raises:
+            DDSManagerError: If write fails
+        """
+        self._write_sync(topic_name, data)
+
     def subscribe(self, topic_name: str, callback: Optional[Callable] = None) -> str:
         """
         Subscribe to a topic with optional callback.
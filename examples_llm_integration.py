@@ -5,16 +5,91 @@ LLM Integration Examples for DDS Chatbot
 This file shows how to integrate various LLMs with the DDS chatbot agent.
 Choose the integration that works best for your use case.
 """
+import asyncio
 import logging
-from typing import Optional
+from collections import OrderedDict
+from typing import AsyncIterator, List, Optional, Tuple
 from abc import ABC, abstractmethod
 
 logger = logging.getLogger(__name__)
 
 
+# Prompts containing these markers are likely time-sensitive and should not
+# be served from cache.
+VOLATILE_PROMPT_MARKERS = ("now", "today", "current", "latest", "timestamp")
+
+
+def is_cacheable_prompt(prompt: str) -> bool:
+    """
+    Check whether a prompt is safe to cache.
+
+    Args:
+        prompt: User's input text
+
+    Returns:
+        True if the prompt contains no volatile markers
+    """
+    prompt_lower = prompt.lower()
+    return not any(marker in prompt_lower for marker in VOLATILE_PROMPT_MARKERS)
+
+
+class ResponseCache:
+    """LRU cache for LLM responses keyed by (model, prompt, temperature)."""
+
+    def __init__(self, maxsize: int = 1024):
+        """
+        Initialize response cache.
+
+        Args:
+            maxsize: Maximum number of cached responses
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._cache: "OrderedDict[Tuple, str]" = OrderedDict()
+
+    def get(self, key: Tuple) -> Optional[str]:
+        """
+        Look up a cached response.
+
+        Args:
+            key: Cache key tuple (model, prompt, temperature)
+
+        Returns:
+            Cached response or None on miss
+        """
+        response = self._cache.get(key)
+        if response is None:
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        self._cache.move_to_end(key)
+        return response
+
+    def put(self, key: Tuple, response: str) -> None:
+        """
+        Store a response, evicting the least recently used entry if full.
+
+        Args:
+            key: Cache key tuple (model, prompt, temperature)
+            response: Response text to cache
+        """
+        self._cache[key] = response
+        self._cache.move_to_end(key)
+        if len(self._cache) > self.maxsize:
+            self._cache.popitem(last=False)
+
+    @property
+    def hit_rate(self) -> float:
+        """Get cache hit rate (0.0 to 1.0)."""
+        total = self.hits + self.misses
+        return self.hits / total if total > 0 else 0.0
+
+
 class LLMChatbot(ABC):
     """Abstract base class for LLM-based chatbots."""
-    
+
     @abstractmethod
     def generate_response(self, prompt: str) -> str:
         """Generate a response to a prompt."""
@@ -40,27 +115,49 @@ class OpenAIChatbot(LLMChatbot):
             from openai import OpenAI
         except ImportError:
             raise ImportError("Install openai: pip install openai")
-        
-        self.client = OpenAI(api_key=api_key)
+
+        from llm_http import HTTPX_AVAILABLE, get_client
+
+        # Share one HTTP/2 connection pool across adapters so concurrent
+        # requests multiplex instead of opening a TLS connection each.
+        client_kwargs = {"api_key": api_key}
+        if HTTPX_AVAILABLE:
+            client_kwargs["http_client"] = get_client()
+        self.client = OpenAI(**client_kwargs)
         self.model = model
+        self.temperature = 0.7
+        self._cache = ResponseCache(maxsize=1024)
+        # Static system message built once; only the user turn varies per call.
+        self._system_msg = {
+            "role": "system",
+            "content": "You are a helpful assistant integrated with a DDS data mesh system."
+        }
         logger.info(f"Initialized OpenAI chatbot with model: {model}")
-    
+
     def generate_response(self, prompt: str) -> str:
         """Generate response using OpenAI API."""
+        # Identical prompts (greetings, status queries) are common in chat
+        # workloads; serve them from the LRU cache to skip the API round-trip.
+        cacheable = is_cacheable_prompt(prompt)
+        cache_key = (self.model, prompt, self.temperature)
+
+        if cacheable:
+            cached = self._cache.get(cache_key)
+            if cached is not None:
+                logger.debug(f"Response cache hit (hit rate: {self._cache.hit_rate:.2%})")
+                return cached
+
         try:
             response = self.client.chat.completions.create(
                 model=self.model,
-                messages=[
-                    {
-                        "role": "system",
-                        "content": "You are a helpful assistant integrated with a DDS data mesh system."
-                    },
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.7,
+                messages=(self._system_msg, {"role": "user", "content": prompt}),
+                temperature=self.temperature,
                 max_tokens=500
             )
-            return response.choices[0].message.content
+            result = response.choices[0].message.content
+            if cacheable:
+                self._cache.put(cache_key, result)
+            return result
         except Exception as e:
             logger.error(f"OpenAI API error: {e}")
             return f"Error generating response: {e}"
@@ -85,8 +182,13 @@ class ClaudeChatbot(LLMChatbot):
             import anthropic
         except ImportError:
             raise ImportError("Install anthropic: pip install anthropic")
-        
-        self.client = anthropic.Anthropic(api_key=api_key)
+
+        from llm_http import HTTPX_AVAILABLE, get_client
+
+        client_kwargs = {"api_key": api_key}
+        if HTTPX_AVAILABLE:
+            client_kwargs["http_client"] = get_client()
+        self.client = anthropic.Anthropic(**client_kwargs)
         self.model = model
         logger.info(f"Initialized Claude chatbot with model: {model}")
     
@@ -131,13 +233,14 @@ class OllamaChatbot(LLMChatbot):
         
         self.base_url = base_url
         self.model = model
-        self.requests = requests
+        # Keep-alive session: avoids a fresh TCP connection per call
+        self.session = requests.Session()
         logger.info(f"Initialized Ollama chatbot with model: {model}")
-    
+
     def generate_response(self, prompt: str) -> str:
         """Generate response using Ollama."""
         try:
-            response = self.requests.post(
+            response = self.session.post(
                 f"{self.base_url}/api/generate",
                 json={
                     "model": self.model,
@@ -194,40 +297,123 @@ class HuggingFaceChatbot(LLMChatbot):
 # LLaMA 2 Integration (via Replicate)
 # ============================================================================
 
+LLAMA2_MODEL_NAME = "meta/llama-2-7b-chat"
+LLAMA2_MODEL_VERSION = "13c3cdee13ee059ab779f0291d29f6338d3b66fb1124200cd5beb9d2a20eeb41"
+LLAMA2_MODEL = f"{LLAMA2_MODEL_NAME}:{LLAMA2_MODEL_VERSION}"
+
+
 class LLaMA2Chatbot(LLMChatbot):
     """LLaMA 2 chatbot via Replicate API."""
-    
-    def __init__(self, api_token: str):
+
+    def __init__(self, api_token: str, max_concurrency: int = 8):
         """
         Initialize LLaMA 2 chatbot.
-        
+
         Args:
             api_token: Replicate API token
+            max_concurrency: Maximum concurrent Replicate calls for batches
         """
         try:
             import replicate
         except ImportError:
             raise ImportError("Install replicate: pip install replicate")
-        
+
         self.replicate = replicate
         self.replicate.api.token = api_token
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        # Resolved model version handle, cached on first use so each call
+        # skips the server-side lookup of the long model:version identifier
+        self._version = None
         logger.info("Initialized LLaMA 2 chatbot via Replicate")
-    
+
+    def _get_version(self):
+        """Get the cached Replicate model version, resolving it once."""
+        if self._version is None:
+            model = self.replicate.models.get(LLAMA2_MODEL_NAME)
+            self._version = model.versions.get(LLAMA2_MODEL_VERSION)
+        return self._version
+
     def generate_response(self, prompt: str) -> str:
         """Generate response using LLaMA 2."""
         try:
-            output = self.replicate.run(
-                "meta/llama-2-7b-chat:13c3cdee13ee059ab779f0291d29f6338d3b66fb1124200cd5beb9d2a20eeb41",
+            prediction = self.replicate.predictions.create(
+                version=self._get_version(),
                 input={
                     "prompt": prompt,
                     "max_tokens": 500
                 }
             )
-            return "".join(output)
+            prediction.wait()
+            return "".join(prediction.output or [])
         except Exception as e:
             logger.error(f"LLaMA 2 error: {e}")
             return f"Error generating response: {e}"
 
+    async def _run_one(self, prompt: str) -> str:
+        """Run a single prompt through Replicate, bounded by the semaphore."""
+        async with self._semaphore:
+            output = await self.replicate.async_run(
+                LLAMA2_MODEL,
+                input={
+                    "prompt": prompt,
+                    "max_tokens": 500
+                }
+            )
+            return "".join(output)
+
+    async def stream_response(self, prompt: str) -> AsyncIterator[str]:
+        """
+        Stream response chunks from LLaMA 2 as they are generated.
+
+        Unlike generate_response, which blocks until the whole output is
+        joined, this yields tokens as they arrive so consumers can render
+        incrementally - perceived latency drops to time-to-first-token.
+
+        Args:
+            prompt: User's input text
+
+        Yields:
+            Response text chunks
+        """
+        try:
+            async for event in await self.replicate.async_stream(
+                LLAMA2_MODEL,
+                input={
+                    "prompt": prompt,
+                    "max_tokens": 500
+                }
+            ):
+                yield str(event)
+        except Exception as e:
+            logger.error(f"LLaMA 2 streaming error: {e}")
+            yield f"Error generating response: {e}"
+
+    async def generate_batch(self, prompts: List[str]) -> List[str]:
+        """
+        Generate responses for a batch of prompts concurrently.
+
+        Submitting prompts together amortizes the 1-5s network round-trip
+        across the batch; the semaphore keeps concurrency within provider
+        rate limits.
+
+        Args:
+            prompts: List of prompt texts
+
+        Returns:
+            List of response texts (error message string on per-prompt failure)
+        """
+        tasks = [asyncio.create_task(self._run_one(p)) for p in prompts]
+        results = await asyncio.gather(*tasks, return_exceptions=True)
+
+        responses = []
+        for prompt, result in zip(prompts, results):
+            if isinstance(result, Exception):
+                logger.error(f"LLaMA 2 batch error for prompt '{prompt[:50]}': {result}")
+                responses.append(f"Error generating response: {result}")
+            else:
+                responses.append(result)
+        return responses
+
 
 # ============================================================================
 # Usage Examples
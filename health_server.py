@@ -1,10 +1,21 @@
 """Health check and metrics HTTP server for MCP-DDS Gateway."""
 import asyncio
+import json
 import logging
-from typing import Optional, Callable
+import time
+import zlib
+from typing import Optional, Callable, Tuple
 from aiohttp import web
 from metrics_collector import MetricsCollector
 
+try:
+    # uvloop's libuv-based event loop roughly doubles aiohttp throughput
+    # with no code changes; fall back to the stdlib loop when absent
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 
 logger = logging.getLogger(__name__)
 
@@ -26,9 +37,49 @@ class HealthServer:
         self.runner: Optional[web.AppRunner] = None
         self.site: Optional[web.TCPSite] = None
 
-        # Health check callbacks
+        # Health check callbacks; the _async variants are pre-wrapped once
+        # at registration so probe paths never introspect the callable
         self.liveness_check: Optional[Callable] = None
         self.readiness_check: Optional[Callable] = None
+        self._liveness_async: Optional[Callable] = None
+        self._readiness_async: Optional[Callable] = None
+
+        # Latest readiness result refreshed by a background probe loop:
+        # (is_ready, monotonic timestamp, reason). Kubernetes probes hit
+        # /ready on tight intervals, so the handler must not trigger
+        # potentially expensive readiness work itself.
+        self._ready_state: Tuple[bool, float, str] = (True, time.monotonic(), "")
+        self._probe_interval = 2.0
+        self._ready_staleness_limit = 10.0
+        self._probe_task: Optional[asyncio.Task] = None
+
+        # Static JSON payloads serialized once; the healthy /health and
+        # /info responses never change between restarts
+        self._healthy_body = json.dumps({
+            "status": "healthy",
+            "message": "Gateway is alive"
+        }).encode('utf-8')
+        self._info_body = json.dumps({
+            "service": "mcp-dds-gateway",
+            "version": "1.0.0",
+            "endpoints": {
+                "health": "/health",
+                "ready": "/ready",
+                "metrics": "/metrics",
+                "info": "/info"
+            }
+        }).encode('utf-8')
+
+        # Short-TTL metrics snapshot shared by concurrent scrapes:
+        # (monotonic timestamp, exposition bytes, weak ETag)
+        self._metrics_cache: Tuple[float, bytes, str] = (0.0, b"", "")
+        self._metrics_ttl = 1.0
+        # Single-flight: concurrent cache misses await the first scrape's
+        # computation instead of regenerating the exposition N times
+        self._metrics_inflight: Optional[asyncio.Future] = None
+        # Reusable scratch buffer for assembling the exposition, avoiding a
+        # fresh multi-kilobyte allocation per regeneration
+        self._scratch = bytearray()
 
         # Setup routes
         self._setup_routes()
@@ -51,10 +102,8 @@ class HealthServer:
         """
         try:
             # Check liveness
-            if self.liveness_check:
-                is_alive = await self.liveness_check() if asyncio.iscoroutinefunction(
-                    self.liveness_check
-                ) else self.liveness_check()
+            if self._liveness_async:
+                is_alive = await self._liveness_async()
 
                 if not is_alive:
                     return web.json_response(
@@ -62,10 +111,10 @@ class HealthServer:
                         status=503
                     )
 
-            return web.json_response({
-                "status": "healthy",
-                "message": "Gateway is alive"
-            })
+            return web.Response(
+                body=self._healthy_body,
+                content_type='application/json'
+            )
 
         except Exception as e:
             logger.error(f"Health check error: {e}")
@@ -78,34 +127,50 @@ class HealthServer:
         """
         Handle /ready endpoint (readiness probe).
 
+        Reads the state maintained by the background probe loop instead of
+        running the readiness check inline, so probes stay O(1).
+
         Returns:
-            200 if server is ready, 503 if not
+            200 if server is ready, 503 if not (or if the state is stale)
         """
-        try:
-            # Check readiness
-            if self.readiness_check:
-                is_ready = await self.readiness_check() if asyncio.iscoroutinefunction(
-                    self.readiness_check
-                ) else self.readiness_check()
+        is_ready, checked_at, reason = self._ready_state
 
-                if not is_ready:
-                    return web.json_response(
-                        {"status": "not_ready", "message": "Readiness check failed"},
-                        status=503
-                    )
-
-            return web.json_response({
-                "status": "ready",
-                "message": "Gateway is ready to serve requests"
-            })
+        # A probe loop that stopped updating is itself a readiness failure
+        if self.readiness_check and (
+                time.monotonic() - checked_at > self._ready_staleness_limit):
+            return web.json_response(
+                {"status": "not_ready", "message": "Readiness state is stale"},
+                status=503
+            )
 
-        except Exception as e:
-            logger.error(f"Readiness check error: {e}")
+        if not is_ready:
             return web.json_response(
-                {"status": "not_ready", "error": str(e)},
+                {"status": "not_ready", "message": reason or "Readiness check failed"},
                 status=503
             )
 
+        return web.json_response({
+            "status": "ready",
+            "message": "Gateway is ready to serve requests"
+        })
+
+    async def _probe_loop(self) -> None:
+        """Run the readiness check periodically and record the result."""
+        while True:
+            try:
+                if self._readiness_async:
+                    result = await self._readiness_async()
+                    self._ready_state = (bool(result), time.monotonic(), "")
+                else:
+                    self._ready_state = (True, time.monotonic(), "")
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.error(f"Readiness check error: {e}")
+                self._ready_state = (False, time.monotonic(), str(e))
+
+            await asyncio.sleep(self._probe_interval)
+
     async def _handle_metrics(self, request: web.Request) -> web.Response:
         """
         Handle /metrics endpoint (Prometheus metrics).
@@ -120,12 +185,34 @@ class HealthServer:
                     content_type="text/plain"
                 )
 
-            metrics_text = self.metrics_collector.get_metrics_text()
-
-            return web.Response(
-                text=metrics_text,
-                content_type="text/plain; version=0.0.4"
-            )
+            ts, metrics_body, etag = self._metrics_cache
+            if time.monotonic() - ts < self._metrics_ttl:
+                # Fresh snapshot: serve pre-encoded bytes directly
+                return self._metrics_response(request, metrics_body, etag)
+
+            inflight = self._metrics_inflight
+            if inflight is not None:
+                # Another scrape is already regenerating; share its result
+                metrics_body, etag = await inflight
+                return self._metrics_response(request, metrics_body, etag)
+
+            # Leader: rebuild the exposition into the reusable scratch
+            # buffer, refresh the snapshot and resolve waiting scrapes
+            self._metrics_inflight = future = asyncio.get_running_loop().create_future()
+            try:
+                self._scratch.clear()
+                self.metrics_collector.fill_metrics(self._scratch)
+                metrics_body = bytes(self._scratch)
+                etag = 'W/"%08x"' % zlib.crc32(metrics_body)
+                self._metrics_cache = (time.monotonic(), metrics_body, etag)
+                future.set_result((metrics_body, etag))
+                return self._metrics_response(request, metrics_body, etag)
+            except Exception as e:
+                future.set_exception(e)
+                future.exception()  # mark retrieved; waiters re-raise their copy
+                raise
+            finally:
+                self._metrics_inflight = None
 
         except Exception as e:
             logger.error(f"Metrics endpoint error: {e}")
@@ -135,6 +222,30 @@ class HealthServer:
                 status=500
             )
 
+    @staticmethod
+    def _metrics_response(request: web.Request, body: bytes, etag: str) -> web.Response:
+        """
+        Build a metrics response from cached exposition bytes.
+
+        Args:
+            request: Incoming scrape request (checked for If-None-Match)
+            body: Pre-encoded exposition bytes
+            etag: Weak ETag for the body
+
+        Returns:
+            304 response when the scraper already has this body, else 200
+        """
+        if request.headers.get("If-None-Match") == etag:
+            return web.Response(status=304, headers={"ETag": etag})
+        resp = web.Response(
+            body=body,
+            content_type="text/plain; version=0.0.4",
+            headers={"ETag": etag}
+        )
+        if "gzip" in request.headers.get("Accept-Encoding", ""):
+            resp.enable_compression()
+        return resp
+
     async def _handle_info(self, request: web.Request) -> web.Response:
         """
         Handle /info endpoint (gateway information).
@@ -142,40 +253,35 @@ class HealthServer:
         Returns:
             Gateway information as JSON
         """
-        try:
-            info = {
-                "service": "mcp-dds-gateway",
-                "version": "1.0.0",
-                "endpoints": {
-                    "health": "/health",
-                    "ready": "/ready",
-                    "metrics": "/metrics",
-                    "info": "/info"
-                }
-            }
-
-            return web.json_response(info)
-
-        except Exception as e:
-            logger.error(f"Info endpoint error: {e}")
-            return web.json_response(
-                {"error": str(e)},
-                status=500
-            )
+        return web.Response(
+            body=self._info_body,
+            content_type='application/json'
+        )
 
     async def start(self) -> None:
         """Start the health server."""
         try:
-            self.runner = web.AppRunner(self.app)
+            # Probe/metrics traffic doesn't need per-request access logging
+            # or signal handling; dropping them trims the handler chain
+            self.runner = web.AppRunner(
+                self.app,
+                access_log=None,
+                handle_signals=False
+            )
             await self.runner.setup()
 
             self.site = web.TCPSite(
                 self.runner,
                 '0.0.0.0',
-                self.port
+                self.port,
+                backlog=256,
+                reuse_port=True
             )
             await self.site.start()
 
+            # Keep /ready O(1): readiness work runs here, not per probe
+            self._probe_task = asyncio.create_task(self._probe_loop())
+
             logger.info(f"Health server started on http://0.0.0.0:{self.port}")
 
         except Exception as e:
@@ -185,6 +291,10 @@ class HealthServer:
     async def stop(self) -> None:
         """Stop the health server."""
         try:
+            if self._probe_task:
+                self._probe_task.cancel()
+                self._probe_task = None
+
             if self.site:
                 await self.site.stop()
 
@@ -196,6 +306,28 @@ class HealthServer:
         except Exception as e:
             logger.error(f"Error stopping health server: {e}")
 
+    @staticmethod
+    def _as_async(callback: Callable) -> Callable:
+        """
+        Wrap a callback so it can always be awaited.
+
+        Resolving coroutine-ness once here keeps per-request reflection
+        (asyncio.iscoroutinefunction) off the probe hot path.
+
+        Args:
+            callback: Sync or async zero-argument callable
+
+        Returns:
+            Async callable wrapping the original
+        """
+        if asyncio.iscoroutinefunction(callback):
+            return callback
+
+        async def _call():
+            return callback()
+
+        return _call
+
     def set_liveness_check(self, callback: Callable) -> None:
         """
         Set liveness check callback.
@@ -204,6 +336,7 @@ class HealthServer:
             callback: Function that returns True if alive, False otherwise
         """
         self.liveness_check = callback
+        self._liveness_async = self._as_async(callback)
 
     def set_readiness_check(self, callback: Callable) -> None:
         """
@@ -213,6 +346,7 @@ class HealthServer:
             callback: Function that returns True if ready, False otherwise
         """
         self.readiness_check = callback
+        self._readiness_async = self._as_async(callback)
 
 
 async def example_usage():
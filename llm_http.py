@@ -0,0 +1,97 @@
+"""Shared HTTP client for LLM provider adapters.
+
+Each provider SDK creates its own connection pool by default, so under
+concurrent agent traffic the gateway opens many TCP+TLS connections per
+upstream. Sharing one HTTP/2-capable client lets hundreds of concurrent
+requests multiplex onto a handful of warm TLS sessions and avoids
+client-side port exhaustion.
+"""
+import atexit
+import logging
+from typing import Optional
+
+try:
+    import httpx
+    HTTPX_AVAILABLE = True
+except ImportError:
+    HTTPX_AVAILABLE = False
+    logging.warning("httpx not available. LLM adapters will use per-SDK connection pools.")
+
+
+logger = logging.getLogger(__name__)
+
+
+_client: Optional["httpx.Client"] = None
+_async_client: Optional["httpx.AsyncClient"] = None
+
+
+def _pool_kwargs() -> dict:
+    """Build the shared pool configuration for both client flavors."""
+    return {
+        "http2": True,
+        "limits": httpx.Limits(
+            max_connections=64,
+            max_keepalive_connections=32,
+            keepalive_expiry=90.0
+        ),
+        "timeout": httpx.Timeout(60.0, connect=5.0),
+    }
+
+
+def get_client() -> "httpx.Client":
+    """
+    Get the shared synchronous HTTP client, creating it on first use.
+
+    Pass as http_client= to SDKs that accept one (OpenAI, Anthropic).
+
+    Returns:
+        Shared httpx.Client
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    global _client
+    if not HTTPX_AVAILABLE:
+        raise ImportError("Install httpx: pip install 'httpx[http2]'")
+
+    if _client is None:
+        _client = httpx.Client(**_pool_kwargs())
+        logger.info("Created shared HTTP/2 client for LLM adapters")
+    return _client
+
+
+def get_async_client() -> "httpx.AsyncClient":
+    """
+    Get the shared asynchronous HTTP client, creating it on first use.
+
+    Returns:
+        Shared httpx.AsyncClient
+
+    Raises:
+        ImportError: If httpx is not installed
+    """
+    global _async_client
+    if not HTTPX_AVAILABLE:
+        raise ImportError("Install httpx: pip install 'httpx[http2]'")
+
+    if _async_client is None:
+        _async_client = httpx.AsyncClient(**_pool_kwargs())
+        logger.info("Created shared async HTTP/2 client for LLM adapters")
+    return _async_client
+
+
+async def aclose_async_client() -> None:
+    """Close the shared async client (call during application shutdown)."""
+    global _async_client
+    if _async_client is not None:
+        await _async_client.aclose()
+        _async_client = None
+
+
+@atexit.register
+def _close_client() -> None:
+    """Close the shared sync client at interpreter exit."""
+    global _client
+    if _client is not None:
+        _client.close()
+        _client = None
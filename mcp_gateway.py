@@ -6,16 +6,37 @@ Main gateway implementation for bridging AI agents to DDS via Model Context Prot
 import asyncio
 import logging
 import sys
-from typing import Any, Dict, List, Optional
+from collections import defaultdict
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 from pathlib import Path
 
 from mcp.server import Server
 from mcp.server.stdio import stdio_server
 from mcp import types
 
+try:
+    # Drop-in faster event loop; the gateway works identically without it
+    import uvloop
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+except ImportError:
+    pass
+
 from config_manager import load_configuration, ConfigurationError
 from dds_manager import DDSManager, DDSManagerError
 
+try:
+    import orjson
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize a tool result to JSON text (orjson fast path)."""
+        return orjson.dumps(obj).decode('utf-8')
+except ImportError:
+    import json
+
+    def _json_dumps(obj: Any) -> str:
+        """Serialize a tool result to JSON text (stdlib fallback)."""
+        return json.dumps(obj)
+
 
 # Configure logging
 logging.basicConfig(
@@ -29,6 +50,76 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+# Sentinel marking the end of a batched stream
+_STREAM_DONE = object()
+
+
+async def batched_stream(chunks: AsyncIterator[str],
+                         max_ms: int = 50,
+                         max_chunks: int = 16) -> AsyncIterator[str]:
+    """
+    Coalesce a token stream into larger chunks before transport.
+
+    Emitting every LLM token as a separate MCP message pays per-chunk
+    serialization and transport overhead that dominates at high QPS.
+    This buffers tokens and flushes when either max_chunks tokens have
+    accumulated or max_ms milliseconds have elapsed since the first
+    buffered token, whichever comes first.
+
+    Args:
+        chunks: Source async iterator of text chunks (e.g. streamed tokens)
+        max_ms: Maximum buffering time in milliseconds before a flush
+        max_chunks: Maximum number of chunks to concatenate per flush
+
+    Yields:
+        Concatenated text chunks
+    """
+    queue: asyncio.Queue = asyncio.Queue()
+    pump_error: List[BaseException] = []
+
+    async def _pump():
+        try:
+            async for chunk in chunks:
+                await queue.put(chunk)
+        except Exception as e:
+            pump_error.append(e)
+        finally:
+            await queue.put(_STREAM_DONE)
+
+    pump_task = asyncio.create_task(_pump())
+    loop = asyncio.get_running_loop()
+
+    try:
+        finished = False
+        while not finished:
+            item = await queue.get()
+            if item is _STREAM_DONE:
+                break
+
+            buffer = [item]
+            deadline = loop.time() + max_ms / 1000.0
+
+            while len(buffer) < max_chunks:
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    break
+                try:
+                    item = await asyncio.wait_for(queue.get(), timeout=remaining)
+                except asyncio.TimeoutError:
+                    break
+                if item is _STREAM_DONE:
+                    finished = True
+                    break
+                buffer.append(item)
+
+            yield "".join(buffer)
+
+        if pump_error:
+            raise pump_error[0]
+    finally:
+        pump_task.cancel()
+
+
 class MCPDDSGateway:
     """MCP-DDS Gateway server implementation."""
 
@@ -39,8 +130,20 @@ class MCPDDSGateway:
         self.gateway_config = None
         self.types_config = None
 
-        # Track active agent sessions
-        self.active_agents: Dict[str, Dict] = {}
+        # Track active agent sessions; the factory makes first-touch
+        # insertion and lookup a single dict operation
+        self.active_agents: Dict[str, Dict] = defaultdict(
+            lambda: {"subscriptions": []}
+        )
+
+        # Topic info responses are stable between config reloads; cache them
+        # so repeated get_topic_info calls skip the type-definition lookup
+        self._topic_info_cache: Dict[str, Dict] = {}
+
+        # Optional async hook(prompt) -> str used by the read tool to run
+        # an LLM prefetch concurrently with the DDS read (set by deployments
+        # that attach an LLM adapter; the gateway itself has none)
+        self.llm_prefetch: Optional[Callable] = None
 
         # Setup MCP tool handlers
         self._setup_tools()
@@ -50,137 +153,149 @@ class MCPDDSGateway:
     def _setup_tools(self) -> None:
         """Register MCP tools with the server."""
 
-        @self.server.list_tools()
-        async def list_tools() -> List[types.Tool]:
-            """List available MCP tools."""
-            return [
-                types.Tool(
-                    name="subscribe",
-                    description="Subscribe to a DDS topic and receive real-time updates",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_name": {
-                                "type": "string",
-                                "description": "Name of the agent requesting subscription"
-                            },
-                            "topic_name": {
-                                "type": "string",
-                                "description": "DDS topic name to subscribe to"
-                            }
+        # Tool schemas are static; build them once instead of reallocating
+        # six Tool objects with nested dicts on every list_tools call
+        self._tool_list = [
+            types.Tool(
+                name="subscribe",
+                description="Subscribe to a DDS topic and receive real-time updates",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "agent_name": {
+                            "type": "string",
+                            "description": "Name of the agent requesting subscription"
                         },
-                        "required": ["agent_name", "topic_name"]
-                    }
-                ),
-                types.Tool(
-                    name="read",
-                    description="Read samples from a DDS topic (one-time read)",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_name": {
-                                "type": "string",
-                                "description": "Name of the agent requesting data"
-                            },
-                            "topic_name": {
-                                "type": "string",
-                                "description": "DDS topic name to read from"
-                            },
-                            "max_samples": {
-                                "type": "integer",
-                                "description": "Maximum number of samples to read",
-                                "default": 10
-                            }
+                        "topic_name": {
+                            "type": "string",
+                            "description": "DDS topic name to subscribe to"
+                        }
+                    },
+                    "required": ["agent_name", "topic_name"]
+                }
+            ),
+            types.Tool(
+                name="read",
+                description="Read samples from a DDS topic (one-time read)",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "agent_name": {
+                            "type": "string",
+                            "description": "Name of the agent requesting data"
                         },
-                        "required": ["agent_name", "topic_name"]
-                    }
-                ),
-                types.Tool(
-                    name="write",
-                    description="Write a sample to a DDS topic",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_name": {
-                                "type": "string",
-                                "description": "Name of the agent writing data"
-                            },
-                            "topic_name": {
-                                "type": "string",
-                                "description": "DDS topic name to write to"
-                            },
-                            "data": {
-                                "type": "object",
-                                "description": "Sample data to write"
-                            }
+                        "topic_name": {
+                            "type": "string",
+                            "description": "DDS topic name to read from"
                         },
-                        "required": ["agent_name", "topic_name", "data"]
-                    }
-                ),
-                types.Tool(
-                    name="unsubscribe",
-                    description="Unsubscribe from a DDS topic",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "subscription_id": {
-                                "type": "string",
-                                "description": "Subscription ID to cancel"
-                            }
+                        "max_samples": {
+                            "type": "integer",
+                            "description": "Maximum number of samples to read",
+                            "default": 10
                         },
-                        "required": ["subscription_id"]
-                    }
-                ),
-                types.Tool(
-                    name="list_topics",
-                    description="List all available DDS topics",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "agent_name": {
-                                "type": "string",
-                                "description": "Name of the agent"
-                            }
+                        "followup_prompt": {
+                            "type": "string",
+                            "description": "Optional LLM prompt to evaluate concurrently with the read"
+                        }
+                    },
+                    "required": ["agent_name", "topic_name"]
+                }
+            ),
+            types.Tool(
+                name="write",
+                description="Write a sample to a DDS topic",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "agent_name": {
+                            "type": "string",
+                            "description": "Name of the agent writing data"
                         },
-                        "required": ["agent_name"]
-                    }
-                ),
-                types.Tool(
-                    name="get_topic_info",
-                    description="Get detailed information about a DDS topic",
-                    inputSchema={
-                        "type": "object",
-                        "properties": {
-                            "topic_name": {
-                                "type": "string",
-                                "description": "DDS topic name"
-                            }
+                        "topic_name": {
+                            "type": "string",
+                            "description": "DDS topic name to write to"
                         },
-                        "required": ["topic_name"]
-                    }
-                )
-            ]
+                        "data": {
+                            "type": "object",
+                            "description": "Sample data to write"
+                        }
+                    },
+                    "required": ["agent_name", "topic_name", "data"]
+                }
+            ),
+            types.Tool(
+                name="unsubscribe",
+                description="Unsubscribe from a DDS topic",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "subscription_id": {
+                            "type": "string",
+                            "description": "Subscription ID to cancel"
+                        }
+                    },
+                    "required": ["subscription_id"]
+                }
+            ),
+            types.Tool(
+                name="list_topics",
+                description="List all available DDS topics",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "agent_name": {
+                            "type": "string",
+                            "description": "Name of the agent"
+                        }
+                    },
+                    "required": ["agent_name"]
+                }
+            ),
+            types.Tool(
+                name="get_topic_info",
+                description="Get detailed information about a DDS topic",
+                inputSchema={
+                    "type": "object",
+                    "properties": {
+                        "topic_name": {
+                            "type": "string",
+                            "description": "DDS topic name"
+                        }
+                    },
+                    "required": ["topic_name"]
+                }
+            )
+        ]
+
+        # O(1) dispatch table of bound handlers, replacing a per-call
+        # if/elif chain of string compares
+        self._tool_handlers = {
+            "subscribe": self._handle_subscribe,
+            "read": self._handle_read,
+            "write": self._handle_write,
+            "unsubscribe": self._handle_unsubscribe,
+            "list_topics": self._handle_list_topics,
+            "get_topic_info": self._handle_get_topic_info,
+        }
+
+        @self.server.list_tools()
+        async def list_tools() -> List[types.Tool]:
+            """List available MCP tools."""
+            return self._tool_list
 
         @self.server.call_tool()
         async def call_tool(name: str, arguments: Any) -> List[types.TextContent]:
             """Handle MCP tool calls."""
             try:
-                if name == "subscribe":
-                    result = await self._handle_subscribe(arguments)
-                elif name == "read":
-                    result = await self._handle_read(arguments)
-                elif name == "write":
-                    result = await self._handle_write(arguments)
-                elif name == "unsubscribe":
-                    result = await self._handle_unsubscribe(arguments)
-                elif name == "list_topics":
-                    result = await self._handle_list_topics(arguments)
-                elif name == "get_topic_info":
-                    result = await self._handle_get_topic_info(arguments)
+                handler = self._tool_handlers.get(name)
+                if handler is not None:
+                    result = await handler(arguments)
                 else:
                     result = {"error": f"Unknown tool: {name}"}
 
-                return [types.TextContent(type="text", text=str(result))]
+                # str(dict) produces repr (single quotes, not valid JSON);
+                # serialize properly so agents can parse tool results
+                return [types.TextContent(type="text", text=_json_dumps(result))]
 
             except Exception as e:
                 logger.error(f"Error handling tool '{name}': {e}", exc_info=True)
@@ -206,8 +321,6 @@ class MCPDDSGateway:
             subscription_id = self.dds_manager.subscribe(topic_name)
 
             # Track subscription for this agent
-            if agent_name not in self.active_agents:
-                self.active_agents[agent_name] = {"subscriptions": []}
             self.active_agents[agent_name]["subscriptions"].append(subscription_id)
 
             logger.info(f"Agent '{agent_name}' subscribed to '{topic_name}' (ID: {subscription_id})")
@@ -245,17 +358,33 @@ class MCPDDSGateway:
             max_samples = max_allowed
             logger.info(f"Limiting read to {max_allowed} samples (config limit)")
 
+        followup_prompt = args.get("followup_prompt")
+
         try:
-            samples = await self.dds_manager.read_samples(topic_name, max_samples)
+            if followup_prompt and self.llm_prefetch:
+                # The read and the LLM call don't depend on each other, so
+                # run them concurrently and hide one round-trip behind the
+                # other instead of paying both latencies back to back
+                dds_task = asyncio.create_task(
+                    self.dds_manager.read_samples(topic_name, max_samples)
+                )
+                llm_task = asyncio.create_task(self.llm_prefetch(followup_prompt))
+                samples, llm_response = await asyncio.gather(dds_task, llm_task)
+            else:
+                samples = await self.dds_manager.read_samples(topic_name, max_samples)
+                llm_response = None
 
             logger.info(f"Agent '{agent_name}' read {len(samples)} samples from '{topic_name}'")
 
-            return {
+            result = {
                 "success": True,
                 "topic_name": topic_name,
                 "samples": samples,
                 "count": len(samples)
             }
+            if llm_response is not None:
+                result["llm_response"] = llm_response
+            return result
 
         except Exception as e:
             logger.error(f"Read failed: {e}")
@@ -347,6 +476,10 @@ class MCPDDSGateway:
         """Handle get_topic_info tool call."""
         topic_name = args["topic_name"]
 
+        cached = self._topic_info_cache.get(topic_name)
+        if cached is not None:
+            return cached
+
         try:
             # Get type definition for the topic
             type_def = self.types_config.get_type_definition(topic_name)
@@ -357,11 +490,13 @@ class MCPDDSGateway:
                     "error": f"Topic '{topic_name}' not found"
                 }
 
-            return {
+            result = {
                 "success": True,
                 "topic_name": topic_name,
                 "type_definition": type_def
             }
+            self._topic_info_cache[topic_name] = result
+            return result
 
         except Exception as e:
             logger.error(f"Get topic info failed: {e}")
@@ -377,6 +512,9 @@ class MCPDDSGateway:
             logger.info("Loading configuration...")
             self.gateway_config, self.types_config = load_configuration()
 
+            # Cached topic info may be stale after a config (re)load
+            self._topic_info_cache.clear()
+
             # Set log level from config
             log_level = getattr(logging, self.gateway_config.log_level, logging.INFO)
             logging.getLogger().setLevel(log_level)
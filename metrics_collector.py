@@ -1,7 +1,11 @@
 """Prometheus metrics collector for MCP-DDS Gateway."""
+import functools
 import logging
+import sys
+import threading
 import time
-from typing import Dict, Optional
+from collections import defaultdict
+from typing import Callable, Dict, Iterator, Optional, Set
 from prometheus_client import (
     Counter,
     Histogram,
@@ -11,23 +15,187 @@ from prometheus_client import (
     REGISTRY,
     CollectorRegistry
 )
+from prometheus_client.core import CounterMetricFamily
 from prometheus_client.exposition import choose_encoder
 
 
 logger = logging.getLogger(__name__)
 
+# Monotonic integer clock for request timing: immune to wall-clock
+# adjustments and cheaper than float time.time(). Bound at module level
+# so timers skip the time-module attribute lookup per call.
+_now = time.monotonic_ns
+
+# Interned constants for the small fixed label vocabularies. Callers that
+# pass these make the label-tuple hash inside .labels() compare by
+# identity instead of re-hashing string contents.
+OP_SUBSCRIBE = sys.intern("subscribe")
+OP_READ = sys.intern("read")
+OP_WRITE = sys.intern("write")
+OP_UNSUBSCRIBE = sys.intern("unsubscribe")
+STATUS_SUCCESS = sys.intern("success")
+STATUS_ERROR = sys.intern("error")
+STATUS_DENIED = sys.intern("denied")
+DIRECTION_READ = OP_READ
+DIRECTION_WRITE = OP_WRITE
+
+# Exception names worth distinguishing in errors_total. exc.__name__ is
+# unbounded (any library exception spawns a series), so anything outside
+# this allowlist is folded into "other".
+KNOWN_ERRORS = frozenset({
+    "TimeoutError",
+    "ConnectionError",
+    "RateLimitExceeded",
+    "PermissionError",
+    "ValueError",
+    "KeyError",
+})
+
+
+def _make_histogram(name: str, documentation: str, labelnames: tuple,
+                    fallback_buckets: tuple,
+                    registry: CollectorRegistry) -> Histogram:
+    """
+    Build a duration histogram, preferring native (exponential) buckets.
+
+    A native histogram is one self-adapting series instead of one series
+    per classic bucket per labelset. Older prometheus-client releases
+    don't accept the native kwargs, so fall back to the classic bucket
+    list there.
+
+    Args:
+        name: Metric name
+        documentation: Metric help text
+        labelnames: Label names
+        fallback_buckets: Classic bucket bounds used on older clients
+        registry: Registry to register with
+
+    Returns:
+        Configured Histogram
+    """
+    try:
+        return Histogram(
+            name,
+            documentation,
+            labelnames,
+            native_histogram_bucket_factor=1.1,
+            native_histogram_max_buckets=100,
+            registry=registry
+        )
+    except TypeError:
+        return Histogram(
+            name,
+            documentation,
+            labelnames,
+            buckets=fallback_buckets,
+            registry=registry
+        )
+
+
+class FastCounter:
+    """
+    Minimal counter collector for a single hot metric.
+
+    prometheus_client's Counter pays keyword processing, child lookup and
+    a per-value mutex on every inc; for per-sample counting that cost
+    dominates. This collector stores values in a plain dict keyed by the
+    label tuple (one dict update per inc, atomic under the GIL) and
+    renders a standard counter family at scrape time, so the exposition
+    output is unchanged.
+    """
+
+    __slots__ = ('_name', '_documentation', '_labelnames', '_d')
+
+    def __init__(self, name: str, documentation: str, labelnames: tuple,
+                 registry: Optional[CollectorRegistry] = None):
+        """
+        Initialize fast counter.
+
+        Args:
+            name: Metric name without the _total suffix
+            documentation: Metric help text
+            labelnames: Label names
+            registry: Registry to register with
+        """
+        self._name = name
+        self._documentation = documentation
+        self._labelnames = labelnames
+        self._d: Dict[tuple, float] = {}
+        if registry is not None:
+            registry.register(self)
+
+    def inc(self, labels: tuple, amount: float = 1) -> None:
+        """
+        Increment the series for a label tuple.
+
+        Args:
+            labels: Label values, ordered like labelnames
+            amount: Amount to add
+        """
+        d = self._d
+        d[labels] = d.get(labels, 0) + amount
+
+    def collect(self):
+        """Yield the counter family for scraping."""
+        family = CounterMetricFamily(
+            self._name, self._documentation, labels=self._labelnames)
+        for labels, value in self._d.items():
+            family.add_metric(labels, value)
+        return (family,)
+
+
+class _SingleMetricRegistry:
+    """Minimal registry view exposing one already-collected metric family."""
+
+    __slots__ = ('_metric',)
+
+    def __init__(self, metric):
+        self._metric = metric
+
+    def collect(self):
+        return (self._metric,)
+
 
 class MetricsCollector:
     """Collects and exports Prometheus metrics for the gateway."""
 
-    def __init__(self, registry: Optional[CollectorRegistry] = None):
+    __slots__ = (
+        'registry',
+        'requests_total', 'request_duration',
+        'dds_samples_total', 'dds_operation_duration',
+        'active_subscriptions', 'subscriptions_total',
+        'active_participants', 'active_agents',
+        'rate_limit_exceeded', 'errors_total', 'permission_denied',
+        'gateway_info', 'gateway_start_time',
+        '_req_children', '_dds_op_children',
+        '_sub_children', '_active_sub_children',
+        '_error_children', '_perm_children', '_rate_children',
+        '_seen', '_max_card',
+        '_cached_bytes', '_cached_at', '_cache_ttl', '_cache_lock',
+    )
+
+    def __init__(self, registry: Optional[CollectorRegistry] = None,
+                 max_label_cardinality: int = 200,
+                 metrics_cache_ttl: float = 1.0):
         """
         Initialize metrics collector.
 
         Args:
             registry: Optional Prometheus registry (uses default if None)
+            max_label_cardinality: Maximum distinct values tracked per
+                user-controllable label before folding into "__other__"
+            metrics_cache_ttl: Seconds a serialized exposition snapshot is
+                reused before regenerating (0 disables caching)
         """
         self.registry = registry or REGISTRY
+        self._max_card = max_label_cardinality
+
+        # Serialized exposition snapshot shared by scrapes within the TTL;
+        # regeneration walks every collector, so do it once per window
+        self._cached_bytes = b''
+        self._cached_at = float('-inf')
+        self._cache_ttl = metrics_cache_ttl
+        self._cache_lock = threading.Lock()
 
         # Request metrics
         self.requests_total = Counter(
@@ -37,27 +205,28 @@ class MetricsCollector:
             registry=self.registry
         )
 
-        self.request_duration = Histogram(
+        self.request_duration = _make_histogram(
             'mcp_request_duration_seconds',
             'MCP request duration in seconds',
-            ['operation', 'agent'],
-            buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0),
+            ('operation', 'agent'),
+            fallback_buckets=(0.005, 0.01, 0.025, 0.05, 0.075, 0.1, 0.25, 0.5, 0.75, 1.0, 2.5, 5.0, 7.5, 10.0),
             registry=self.registry
         )
 
-        # DDS metrics
-        self.dds_samples_total = Counter(
-            'dds_samples_total',
+        # DDS metrics. Sample counting is the per-message hot path, so it
+        # bypasses the client library's Counter machinery entirely.
+        self.dds_samples_total = FastCounter(
+            'dds_samples',
             'Total number of DDS samples processed',
-            ['topic', 'direction'],  # direction: read or write
+            ('topic', 'direction'),  # direction: read or write
             registry=self.registry
         )
 
-        self.dds_operation_duration = Histogram(
+        self.dds_operation_duration = _make_histogram(
             'dds_operation_duration_seconds',
             'DDS operation duration in seconds',
-            ['operation', 'topic'],
-            buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
+            ('operation', 'topic'),
+            fallback_buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0),
             registry=self.registry
         )
 
@@ -128,8 +297,44 @@ class MetricsCollector:
         )
         self.gateway_start_time.set(time.time())
 
+        # Resolved label children cached per label tuple. prometheus-client
+        # caches children too, but behind keyword processing and a lock;
+        # caching the bound inc/observe methods directly keeps the record_*
+        # hot paths to one dict get and a plain call.
+        self._req_children: Dict[tuple, tuple] = {}
+        self._dds_op_children: Dict[tuple, Callable] = {}
+        self._sub_children: Dict[tuple, Callable] = {}
+        self._active_sub_children: Dict[str, Gauge] = {}
+        self._error_children: Dict[tuple, Callable] = {}
+        self._perm_children: Dict[tuple, Callable] = {}
+        self._rate_children: Dict[tuple, Callable] = {}
+
+        # Distinct values seen per capped label. agent, topic and
+        # error_type come from callers, so without a cap they can grow
+        # Prometheus series (and our caches) without bound.
+        self._seen: Dict[str, Set[str]] = defaultdict(set)
+
         logger.info("Metrics collector initialized")
 
+    def _cap(self, label_name: str, value: str) -> str:
+        """
+        Bound the cardinality of a user-controllable label.
+
+        Args:
+            label_name: Label being capped (e.g. 'agent', 'topic')
+            value: Proposed label value
+
+        Returns:
+            The value itself while under the cap, else "__other__"
+        """
+        seen = self._seen[label_name]
+        if value in seen:
+            return value
+        if len(seen) < self._max_card:
+            seen.add(value)
+            return value
+        return "__other__"
+
     def record_request(self, operation: str, agent: str, duration: float, status: str) -> None:
         """
         Record an MCP request.
@@ -140,16 +345,32 @@ class MetricsCollector:
             duration: Request duration in seconds
             status: Request status (success, error, denied)
         """
-        self.requests_total.labels(
-            operation=operation,
-            agent=agent,
-            status=status
-        ).inc()
+        inc, observe = self._get_req_children(operation, agent, status)
+        inc()
+        observe(duration)
 
-        self.request_duration.labels(
-            operation=operation,
-            agent=agent
-        ).observe(duration)
+    def _get_req_children(self, operation: str, agent: str, status: str) -> tuple:
+        """
+        Get the cached (inc, observe) pair for a request label set.
+
+        Args:
+            operation: Operation name
+            agent: Agent name (capped for cardinality)
+            status: Request status
+
+        Returns:
+            Tuple of bound (counter.inc, histogram.observe)
+        """
+        agent = self._cap('agent', agent)
+        key = (operation, agent, status)
+        children = self._req_children.get(key)
+        if children is None:
+            children = (
+                self.requests_total.labels(operation, agent, status).inc,
+                self.request_duration.labels(operation, agent).observe
+            )
+            self._req_children[key] = children
+        return children
 
     def record_dds_sample(self, topic: str, direction: str, count: int = 1) -> None:
         """
@@ -160,10 +381,8 @@ class MetricsCollector:
             direction: 'read' or 'write'
             count: Number of samples
         """
-        self.dds_samples_total.labels(
-            topic=topic,
-            direction=direction
-        ).inc(count)
+        topic = self._cap('topic', topic)
+        self.dds_samples_total.inc((topic, direction), count)
 
     def record_dds_operation(self, operation: str, topic: str, duration: float) -> None:
         """
@@ -174,10 +393,14 @@ class MetricsCollector:
             topic: Topic name
             duration: Operation duration in seconds
         """
-        self.dds_operation_duration.labels(
-            operation=operation,
-            topic=topic
-        ).observe(duration)
+        topic = self._cap('topic', topic)
+        key = (operation, topic)
+        observe = self._dds_op_children.get(key)
+        if observe is None:
+            observe = self.dds_operation_duration.labels(
+                operation, topic).observe
+            self._dds_op_children[key] = observe
+        observe(duration)
 
     def record_subscription(self, topic: str, agent: str) -> None:
         """
@@ -187,14 +410,18 @@ class MetricsCollector:
             topic: Topic name
             agent: Agent name
         """
-        self.subscriptions_total.labels(
-            topic=topic,
-            agent=agent
-        ).inc()
+        topic = self._cap('topic', topic)
+        agent = self._cap('agent', agent)
+        key = (topic, agent)
+        inc = self._sub_children.get(key)
+        if inc is None:
+            inc = self.subscriptions_total.labels(topic, agent).inc
+            self._sub_children[key] = inc
+        inc()
 
         # Update active subscriptions gauge
         # This would need to be called with proper increment/decrement
-        self.active_subscriptions.labels(topic=topic).inc()
+        self._get_active_sub_gauge(topic).inc()
 
     def record_unsubscription(self, topic: str) -> None:
         """
@@ -203,7 +430,24 @@ class MetricsCollector:
         Args:
             topic: Topic name
         """
-        self.active_subscriptions.labels(topic=topic).dec()
+        self._get_active_sub_gauge(topic).dec()
+
+    def _get_active_sub_gauge(self, topic: str) -> Gauge:
+        """
+        Get the cached active_subscriptions child for a topic.
+
+        Args:
+            topic: Topic name
+
+        Returns:
+            Resolved gauge child for the topic
+        """
+        topic = self._cap('topic', topic)
+        gauge = self._active_sub_children.get(topic)
+        if gauge is None:
+            gauge = self.active_subscriptions.labels(topic)
+            self._active_sub_children[topic] = gauge
+        return gauge
 
     def record_error(self, operation: str, error_type: str) -> None:
         """
@@ -213,10 +457,14 @@ class MetricsCollector:
             operation: Operation where error occurred
             error_type: Type/class of error
         """
-        self.errors_total.labels(
-            operation=operation,
-            error_type=error_type
-        ).inc()
+        if error_type not in KNOWN_ERRORS:
+            error_type = "other"
+        key = (operation, error_type)
+        inc = self._error_children.get(key)
+        if inc is None:
+            inc = self.errors_total.labels(operation, error_type).inc
+            self._error_children[key] = inc
+        inc()
 
     def record_permission_denied(self, agent: str, topic: str, operation: str) -> None:
         """
@@ -227,11 +475,14 @@ class MetricsCollector:
             topic: Topic name
             operation: Operation attempted (read/write)
         """
-        self.permission_denied.labels(
-            agent=agent,
-            topic=topic,
-            operation=operation
-        ).inc()
+        agent = self._cap('agent', agent)
+        topic = self._cap('topic', topic)
+        key = (agent, topic, operation)
+        inc = self._perm_children.get(key)
+        if inc is None:
+            inc = self.permission_denied.labels(agent, topic, operation).inc
+            self._perm_children[key] = inc
+        inc()
 
     def record_rate_limit_exceeded(self, agent: str, limit_type: str) -> None:
         """
@@ -241,10 +492,13 @@ class MetricsCollector:
             agent: Agent name
             limit_type: 'global' or 'agent'
         """
-        self.rate_limit_exceeded.labels(
-            agent=agent,
-            limit_type=limit_type
-        ).inc()
+        agent = self._cap('agent', agent)
+        key = (agent, limit_type)
+        inc = self._rate_children.get(key)
+        if inc is None:
+            inc = self.rate_limit_exceeded.labels(agent, limit_type).inc
+            self._rate_children[key] = inc
+        inc()
 
     def set_active_agents(self, count: int) -> None:
         """
@@ -280,7 +534,19 @@ class MetricsCollector:
         Returns:
             Metrics as bytes
         """
-        return generate_latest(self.registry)
+        now = time.monotonic()
+        if now - self._cached_at < self._cache_ttl:
+            return self._cached_bytes
+
+        with self._cache_lock:
+            # Another scrape may have regenerated while we waited
+            now = time.monotonic()
+            if now - self._cached_at < self._cache_ttl:
+                return self._cached_bytes
+
+            self._cached_bytes = generate_latest(self.registry)
+            self._cached_at = now
+            return self._cached_bytes
 
     def get_metrics_text(self) -> str:
         """
@@ -291,6 +557,64 @@ class MetricsCollector:
         """
         return self.get_metrics().decode('utf-8')
 
+    def iter_metrics_bytes(self) -> Iterator[bytes]:
+        """
+        Iterate metrics in Prometheus exposition format, one family at a time.
+
+        Lets callers stream the exposition without materializing the whole
+        payload, keeping memory bounded for large metric sets.
+
+        Yields:
+            Pre-encoded exposition bytes for each metric family
+        """
+        for metric in self.registry.collect():
+            yield generate_latest(_SingleMetricRegistry(metric))
+
+    def fill_metrics(self, buf: bytearray) -> None:
+        """
+        Append the Prometheus exposition to a caller-supplied buffer.
+
+        Lets callers reuse one scratch bytearray across scrapes instead of
+        allocating a fresh string per scrape.
+
+        Args:
+            buf: Buffer to extend with pre-encoded exposition bytes
+        """
+        for chunk in self.iter_metrics_bytes():
+            buf += chunk
+
+
+def timed(metrics: MetricsCollector, operation: str, agent: str) -> Callable:
+    """
+    Decorator that times calls without allocating a timer per request.
+
+    The success-path children are resolved once at decoration time, so
+    each call costs two clock reads plus the bound inc/observe. Every
+    call is recorded with status "success"; use RequestTimer when the
+    status can change per call.
+
+    Args:
+        metrics: MetricsCollector instance
+        operation: Operation being timed
+        agent: Agent name
+
+    Returns:
+        Decorator wrapping sync callables
+    """
+    inc, observe = metrics._get_req_children(operation, agent, STATUS_SUCCESS)
+
+    def decorator(fn: Callable) -> Callable:
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            start = _now()
+            try:
+                return fn(*args, **kwargs)
+            finally:
+                inc()
+                observe((_now() - start) * 1e-9)
+        return wrapper
+    return decorator
+
 
 class RequestTimer:
     """Context manager for timing requests and recording metrics."""
@@ -307,21 +631,21 @@ class RequestTimer:
         self.metrics = metrics
         self.operation = operation
         self.agent = agent
-        self.start_time: Optional[float] = None
-        self.status = "success"
+        self.start_time: Optional[int] = None
+        self.status = STATUS_SUCCESS
 
     def __enter__(self):
         """Start timing."""
-        self.start_time = time.time()
+        self.start_time = _now()
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Stop timing and record metrics."""
-        duration = time.time() - self.start_time
+        duration = (_now() - self.start_time) * 1e-9
 
         # Set status based on exception
         if exc_type is not None:
-            self.status = "error"
+            self.status = STATUS_ERROR
             self.metrics.record_error(
                 self.operation,
                 exc_type.__name__
@@ -362,21 +686,21 @@ class AsyncRequestTimer:
         self.metrics = metrics
         self.operation = operation
         self.agent = agent
-        self.start_time: Optional[float] = None
-        self.status = "success"
+        self.start_time: Optional[int] = None
+        self.status = STATUS_SUCCESS
 
     async def __aenter__(self):
         """Start timing."""
-        self.start_time = time.time()
+        self.start_time = _now()
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Stop timing and record metrics."""
-        duration = time.time() - self.start_time
+        duration = (_now() - self.start_time) * 1e-9
 
         # Set status based on exception
         if exc_type is not None:
-            self.status = "error"
+            self.status = STATUS_ERROR
             self.metrics.record_error(
                 self.operation,
                 exc_type.__name__
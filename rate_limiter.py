@@ -1,16 +1,60 @@
 """Rate limiting for MCP-DDS Gateway."""
-import asyncio
 import logging
 import time
-from collections import defaultdict, deque
+from array import array
+from collections import defaultdict
 from dataclasses import dataclass
 from typing import Dict, Optional
 from datetime import datetime, timedelta
 
 
+try:
+    from numba import njit
+    NUMBA_AVAILABLE = True
+except ImportError:
+    NUMBA_AVAILABLE = False
+
+
 logger = logging.getLogger(__name__)
 
 
+# Fixed-point scale for token counts: 20 fractional bits keeps the whole
+# bucket in exact integer arithmetic alongside monotonic_ns timestamps.
+_SCALE_BITS = 20
+_SCALE = 1 << _SCALE_BITS
+
+
+def _tb_step(tokens: int, capacity: int, rate: int, elapsed_ns: int, need: int):
+    """
+    Advance a token bucket by one consume attempt.
+
+    All quantities are fixed-point integers (scaled by _SCALE) except
+    elapsed_ns; pure scalar math kept at module level so it can be
+    JIT-compiled when numba is installed, with an identical interpreted
+    fallback.
+
+    Args:
+        tokens: Current scaled token count
+        capacity: Maximum scaled bucket capacity
+        rate: Scaled tokens added per second
+        elapsed_ns: Nanoseconds since the previous update
+        need: Scaled tokens requested
+
+    Returns:
+        Tuple of (new_tokens, consumed)
+    """
+    tokens = min(capacity, tokens + elapsed_ns * rate // 1_000_000_000)
+    if tokens >= need:
+        return tokens - need, True
+    return tokens, False
+
+
+if NUMBA_AVAILABLE:
+    _tb_step = njit(cache=True)(_tb_step)
+    # Prime compilation at import time so the first request doesn't pay it
+    _tb_step(0, _SCALE, _SCALE, 0, _SCALE)
+
+
 @dataclass
 class RateLimitConfig:
     """Configuration for rate limiting."""
@@ -27,47 +71,67 @@ class RateLimitExceeded(Exception):
 class TokenBucket:
     """Token bucket rate limiter implementation."""
 
-    def __init__(self, rate: float, capacity: int):
+    def __init__(self, rate: float, capacity: int, now=time.monotonic_ns):
         """
         Initialize token bucket.
 
         Args:
             rate: Tokens added per second
             capacity: Maximum bucket capacity (burst size)
+            now: Nanosecond clock used for refill; tests can inject a
+                stepping callable for deterministic timing
         """
-        self.rate = rate  # tokens per second
         self.capacity = capacity
-        self.tokens = capacity
-        self.last_update = time.time()
-        self._lock = asyncio.Lock()
+        self._capacity_scaled = capacity * _SCALE
+        self._tokens_scaled = self._capacity_scaled
+        self._now = now
+        self._last_ns = now()
+        self.rate = rate  # tokens per second (sets the scaled rate too)
+
+    @property
+    def rate(self) -> float:
+        """Get tokens added per second."""
+        return self._rate_scaled / _SCALE
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        """Set tokens added per second, updating the scaled rate."""
+        self._rate_scaled = max(1, int(value * _SCALE))
+        # Elapsed time beyond a full refill adds nothing; clamping it also
+        # keeps the refill product inside 64-bit range for the JIT path
+        self._max_elapsed_ns = (
+            self._capacity_scaled * 1_000_000_000 // self._rate_scaled
+        )
+
+    @property
+    def tokens(self) -> float:
+        """Get the current token count."""
+        return self._tokens_scaled / _SCALE
 
-    async def consume(self, tokens: int = 1) -> bool:
+    def consume(self, tokens: int = 1) -> bool:
         """
         Try to consume tokens from the bucket.
 
+        The whole read-update-decide sequence runs without awaiting, so it
+        is atomic with respect to the event loop and needs no lock.
+
         Args:
             tokens: Number of tokens to consume
 
         Returns:
             True if tokens were consumed, False if rate limit exceeded
         """
-        async with self._lock:
-            now = time.time()
-            elapsed = now - self.last_update
-
-            # Add tokens based on elapsed time
-            self.tokens = min(
-                self.capacity,
-                self.tokens + elapsed * self.rate
-            )
-            self.last_update = now
-
-            # Try to consume tokens
-            if self.tokens >= tokens:
-                self.tokens -= tokens
-                return True
-            else:
-                return False
+        now = self._now()
+        elapsed = now - self._last_ns
+        if elapsed > self._max_elapsed_ns:
+            elapsed = self._max_elapsed_ns
+        self._last_ns = now
+
+        self._tokens_scaled, consumed = _tb_step(
+            self._tokens_scaled, self._capacity_scaled,
+            self._rate_scaled, elapsed, tokens * _SCALE
+        )
+        return bool(consumed)
 
     def get_wait_time(self, tokens: int = 1) -> float:
         """
@@ -99,43 +163,64 @@ class SlidingWindowCounter:
         """
         self.window_size = window_size
         self.max_requests = max_requests
-        self.requests: deque = deque()
-        self._lock = asyncio.Lock()
 
-    async def is_allowed(self) -> bool:
+        # Window length converted to integer nanoseconds once, so pruning
+        # does one int subtraction instead of float math per call
+        self._window_ns = int(window_size * 1_000_000_000)
+
+        # Preallocated ring buffer of monotonic_ns timestamps: O(1) insert
+        # and expiry with no per-request object allocation, unlike a deque
+        # of floats that churns popleft under load
+        self._buf = array('q', [0] * max_requests)
+        self._head = 0  # index of the oldest live entry
+        self._tail = 0  # next write position
+        self._count = 0  # number of live entries
+
+    def _prune(self, now: int) -> None:
+        """
+        Expire ring entries that fell out of the window.
+
+        Args:
+            now: Current monotonic_ns timestamp
+        """
+        cutoff = now - self._window_ns
+        buf = self._buf
+        maxr = self.max_requests
+        head = self._head
+        count = self._count
+        while count and buf[head] < cutoff:
+            head = (head + 1) % maxr
+            count -= 1
+        self._head = head
+        self._count = count
+
+    def is_allowed(self) -> bool:
         """
         Check if a request is allowed.
 
+        Runs without awaiting, so it is atomic with respect to the event
+        loop and needs no lock.
+
         Returns:
             True if request is allowed, False otherwise
         """
-        async with self._lock:
-            now = time.time()
-            cutoff = now - self.window_size
+        now = time.monotonic_ns()
+        self._prune(now)
 
-            # Remove old requests outside the window
-            while self.requests and self.requests[0] < cutoff:
-                self.requests.popleft()
+        # Check if under limit
+        if self._count < self.max_requests:
+            self._buf[self._tail] = now
+            self._tail = (self._tail + 1) % self.max_requests
+            self._count += 1
+            return True
 
-            # Check if under limit
-            if len(self.requests) < self.max_requests:
-                self.requests.append(now)
-                return True
-
-            return False
+        return False
 
     def get_request_count(self) -> int:
         """Get current request count in window."""
-        now = time.time()
-        cutoff = now - self.window_size
-
-        # Count requests in current window
-        count = 0
-        for req_time in self.requests:
-            if req_time >= cutoff:
-                count += 1
-
-        return count
+        # Pruning keeps _count exact, so no scan over the ring is needed
+        self._prune(time.monotonic_ns())
+        return self._count
 
 
 class RateLimiter:
@@ -168,10 +253,11 @@ class RateLimiter:
         self.per_agent_rate = per_agent_rate
         self.per_agent_capacity = int(config.burst_size / 2)  # Smaller burst for agents
 
-        # Metrics
+        # Metrics. Only the two plain int totals are touched on the accept
+        # path; per-agent rejection counts are updated on the (cold)
+        # rejection path only.
         self.total_requests = 0
         self.total_rejected = 0
-        self.agent_requests: Dict[str, int] = defaultdict(int)
         self.agent_rejected: Dict[str, int] = defaultdict(int)
 
         logger.info(
@@ -181,12 +267,14 @@ class RateLimiter:
 
     def _get_agent_limiter(self, agent_name: str) -> TokenBucket:
         """Get or create rate limiter for an agent."""
-        if agent_name not in self.agent_limiters:
-            self.agent_limiters[agent_name] = TokenBucket(
+        bucket = self.agent_limiters.get(agent_name)
+        if bucket is None:
+            bucket = TokenBucket(
                 rate=self.per_agent_rate,
                 capacity=self.per_agent_capacity
             )
-        return self.agent_limiters[agent_name]
+            self.agent_limiters[agent_name] = bucket
+        return bucket
 
     async def check_rate_limit(self, agent_name: str, tokens: int = 1) -> None:
         """
@@ -203,10 +291,9 @@ class RateLimiter:
             return
 
         self.total_requests += 1
-        self.agent_requests[agent_name] += 1
 
         # Check global rate limit
-        if not await self.global_limiter.consume(tokens):
+        if not self.global_limiter.consume(tokens):
             self.total_rejected += 1
             self.agent_rejected[agent_name] += 1
 
@@ -219,9 +306,16 @@ class RateLimiter:
                 f"Global rate limit exceeded. Retry in {wait_time:.2f} seconds"
             )
 
-        # Check per-agent rate limit
-        agent_limiter = self._get_agent_limiter(agent_name)
-        if not await agent_limiter.consume(tokens):
+        # Check per-agent rate limit (inlined lookup: one dict get on the
+        # hot path instead of a helper call plus membership test)
+        agent_limiter = self.agent_limiters.get(agent_name)
+        if agent_limiter is None:
+            agent_limiter = TokenBucket(
+                rate=self.per_agent_rate,
+                capacity=self.per_agent_capacity
+            )
+            self.agent_limiters[agent_name] = agent_limiter
+        if not agent_limiter.consume(tokens):
             self.total_rejected += 1
             self.agent_rejected[agent_name] += 1
 
@@ -265,18 +359,13 @@ class RateLimiter:
             "global_capacity": self.global_limiter.capacity,
             "agent_stats": {
                 agent: {
-                    "requests": self.agent_requests[agent],
                     "rejected": self.agent_rejected[agent],
-                    "rejection_rate": (
-                        self.agent_rejected[agent] / self.agent_requests[agent]
-                        if self.agent_requests[agent] > 0 else 0
-                    ),
                     "tokens_available": (
                         self.agent_limiters[agent].tokens
                         if agent in self.agent_limiters else 0
                     )
                 }
-                for agent in set(list(self.agent_requests.keys()) + list(self.agent_limiters.keys()))
+                for agent in self.agent_rejected.keys() | self.agent_limiters.keys()
             }
         }
 
@@ -284,7 +373,6 @@ class RateLimiter:
         """Reset all metrics counters."""
         self.total_requests = 0
         self.total_rejected = 0
-        self.agent_requests.clear()
         self.agent_rejected.clear()
         logger.info("Rate limiter metrics reset")
 
@@ -302,7 +390,6 @@ class RateLimiter:
 
         return {
             "agent_name": agent_name,
-            "total_requests": self.agent_requests[agent_name],
             "rejected_requests": self.agent_rejected[agent_name],
             "tokens_available": limiter.tokens if limiter else 0,
             "token_capacity": limiter.capacity if limiter else 0,
@@ -324,6 +411,14 @@ class AdaptiveRateLimiter(RateLimiter):
         self.load_threshold = 0.8  # 80% utilization threshold
         self.adjustment_factor = 0.9  # Reduce by 10% when over threshold
 
+        # Constants derived once instead of per adjustment call, which is
+        # awaited on every system-load sample
+        self._orig_rate = config.requests_per_minute / 60.0
+        self._min_rate = 1.0  # Minimum 1 req/sec
+        self._upscale_factor = 1.1
+        self._downscale_factor = self.adjustment_factor
+        self._low_load_threshold = self.load_threshold * 0.5
+
     async def adjust_limits(self, system_load: float) -> None:
         """
         Adjust rate limits based on system load.
@@ -333,18 +428,18 @@ class AdaptiveRateLimiter(RateLimiter):
         """
         if system_load > self.load_threshold:
             # Reduce limits
-            new_rate = self.global_limiter.rate * self.adjustment_factor
-            self.global_limiter.rate = max(1.0, new_rate)  # Minimum 1 req/sec
+            new_rate = self.global_limiter.rate * self._downscale_factor
+            self.global_limiter.rate = max(self._min_rate, new_rate)
 
             logger.info(
                 f"Rate limits adjusted down due to high load ({system_load:.2%}). "
                 f"New rate: {self.global_limiter.rate * 60:.0f} req/min"
             )
-        elif system_load < self.load_threshold * 0.5:
+        elif system_load < self._low_load_threshold:
             # Restore original limits if load is low
-            original_rate = self.base_config.requests_per_minute / 60.0
-            if self.global_limiter.rate < original_rate:
-                self.global_limiter.rate = min(original_rate, self.global_limiter.rate * 1.1)
+            if self.global_limiter.rate < self._orig_rate:
+                self.global_limiter.rate = min(
+                    self._orig_rate, self.global_limiter.rate * self._upscale_factor)
 
                 logger.info(
                     f"Rate limits adjusted up due to low load ({system_load:.2%}). "
@@ -18,7 +18,15 @@ try:
     from cyclonedds.topic import Topic
     from cyclonedds.pub import DataWriter, Publisher
     from cyclonedds.sub import DataReader, Subscriber
-    from cyclonedds.core import Qos, Policy
+    from cyclonedds.core import (
+        Qos,
+        Policy,
+        WaitSet,
+        ReadCondition,
+        SampleState,
+        ViewState,
+        InstanceState
+    )
     from cyclonedds.util import duration
     from dataclasses import dataclass
     from cyclonedds.idl import IdlStruct
@@ -39,13 +47,14 @@ class TestMessage(IdlStruct):
     value: float
 
 
-async def test_publisher():
+async def test_publisher(participant=None):
     """Test publishing messages."""
     logger.info("Starting publisher test...")
 
-    # Create participant
-    participant = DomainParticipant(0)
-    logger.info("Created participant on domain 0")
+    # Create participant unless sharing one with the subscriber
+    if participant is None:
+        participant = DomainParticipant(0)
+        logger.info("Created participant on domain 0")
 
     # Create topic
     topic = Topic(participant, "TestTopic", TestMessage)
@@ -72,13 +81,14 @@ async def test_publisher():
     logger.info("Publisher test complete")
 
 
-async def test_subscriber():
+async def test_subscriber(participant=None):
     """Test subscribing to messages."""
     logger.info("Starting subscriber test...")
 
-    # Create participant
-    participant = DomainParticipant(0)
-    logger.info("Created participant on domain 0")
+    # Create participant unless sharing one with the publisher
+    if participant is None:
+        participant = DomainParticipant(0)
+        logger.info("Created participant on domain 0")
 
     # Create topic
     topic = Topic(participant, "TestTopic", TestMessage)
@@ -90,12 +100,25 @@ async def test_subscriber():
     reader = DataReader(subscriber, topic, qos)
     logger.info("Created data reader")
 
+    # Block on a waitset until data arrives instead of polling every
+    # 100 ms: no wakeups without data and no polling-interval latency
+    waitset = WaitSet(participant)
+    condition = ReadCondition(
+        reader,
+        SampleState.NotRead | ViewState.Any | InstanceState.Alive
+    )
+    waitset.attach(condition)
+
     # Read messages for 10 seconds
     logger.info("Listening for messages (10 seconds)...")
     start_time = time.time()
     message_count = 0
 
     while time.time() - start_time < 10:
+        # waitset.wait blocks the calling thread, so run it in a worker
+        # thread to keep the publisher coroutine on this loop running
+        await asyncio.to_thread(waitset.wait, duration(seconds=1))
+
         # Take samples
         samples = reader.take(10)
 
@@ -104,8 +127,6 @@ async def test_subscriber():
                 message_count += 1
                 logger.info(f"Received #{message_count}: {sample.text} (value={sample.value})")
 
-        await asyncio.sleep(0.1)
-
     logger.info(f"Subscriber test complete. Received {message_count} messages")
 
 
@@ -115,10 +136,16 @@ async def test_pub_sub():
     logger.info("Cyclone DDS Pub/Sub Test")
     logger.info("="*70)
 
-    # Run subscriber and publisher concurrently
-    subscriber_task = asyncio.create_task(test_subscriber())
-    await asyncio.sleep(2)  # Give subscriber time to set up
-    publisher_task = asyncio.create_task(test_publisher())
+    # One participant for both sides: participants are the expensive DDS
+    # entity (discovery threads, sockets), and sharing one also makes
+    # discovery local so the publisher can start immediately
+    participant = DomainParticipant(0)
+    logger.info("Created shared participant on domain 0")
+
+    # Start the subscriber first so its reader exists before writes begin
+    subscriber_task = asyncio.create_task(test_subscriber(participant))
+    await asyncio.sleep(0)  # let the subscriber create its reader
+    publisher_task = asyncio.create_task(test_publisher(participant))
 
     # Wait for both to complete
     await asyncio.gather(subscriber_task, publisher_task)
@@ -1,24 +1,90 @@
 """Pytest configuration and fixtures for MCP-DDS Gateway tests."""
+import asyncio
+import copy
+from pathlib import Path
+
 import pytest
-from unittest.mock import Mock, patch
-from config_manager import GatewayConfig, TypesConfig
+from config_manager import GatewayConfig, TypesConfig, load_configuration
+
+# Read once at import; every TypesConfig below parses from memory
+_XML_BYTES = Path("config/types.xml").read_bytes()
+
+
+class _FakeGatewayConfig:
+    """
+    Plain stand-in for GatewayConfig used by unit tests.
+
+    A plain object is an order of magnitude cheaper to build than
+    Mock(spec=GatewayConfig), which spec-introspects the class on every
+    fixture instantiation. Tests that need call assertions can wrap the
+    individual methods in a Mock themselves.
+    """
+
+    domain_id = 0
+    security_enabled = False
+    certs_base_path = "./certs"
+    gateway_name = "test_gateway"
+    bind_address = "0.0.0.0"
+    port = 8080
+    max_samples_per_read = 100
+    batch_timeout_ms = 50
+    max_cached_entities = 256
+    async_publish = False
+    write_max_blocking_ms = 10
+
+    def get_agent_permissions(self, agent_name=None):
+        return {"read": ["TestTopic"], "write": ["TestTopic"]}
+
+    def get_all_agents(self):
+        return ["test_agent"]
+
+    def get_all_topics(self):
+        return ["TestTopic"]
+
+    def get_dds_qos_profile(self):
+        return {}
+
+
+# Built once at import; the fixture hands each test a shallow copy so
+# per-test attribute tweaks can't leak between tests
+_GATEWAY_CONFIG_TEMPLATE = _FakeGatewayConfig()
+
+
+def pytest_asyncio_loop_factories(config, item):
+    """Run async tests under uvloop when available."""
+    # Same optional-dependency posture as the gateway itself: uvloop cuts
+    # scheduling overhead for the await-heavy tests, stock asyncio works
+    # everywhere else
+    try:
+        import uvloop
+        return {"uvloop": uvloop.new_event_loop}
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+
+
+@pytest.fixture(scope="session")
+def real_gateway_config():
+    """Fixture providing the real gateway configuration, parsed once."""
+    return GatewayConfig("config/gateway_config.json")
+
+
+@pytest.fixture(scope="session")
+def real_types_config():
+    """Fixture providing the real types configuration, parsed once."""
+    return TypesConfig.from_bytes(_XML_BYTES)
+
+
+@pytest.fixture(scope="session")
+def loaded_configs():
+    """Fixture providing the cross-validated config pair, loaded once."""
+    return load_configuration()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def gateway_config():
     """Fixture providing test gateway configuration."""
-    # Mock the GatewayConfig to avoid file I/O during tests
-    config = Mock(spec=GatewayConfig)
-    config.domain_id = 0
-    config.security_enabled = False
-    config.certs_base_path = "./certs"
-    config.gateway_name = "test_gateway"
-    config.bind_address = "0.0.0.0"
-    config.port = 8080
-    config.max_samples_per_read = 100
-    config.batch_timeout_ms = 50
-    config.get_agent_permissions = Mock(return_value={"read": ["TestTopic"], "write": ["TestTopic"]})
-    config.get_all_agents = Mock(return_value=["test_agent"])
-    config.get_all_topics = Mock(return_value=["TestTopic"])
-    config.get_dds_qos_profile = Mock(return_value={})
-    return config
+    # Plain fake instead of a spec'd Mock to avoid file I/O and
+    # per-test mock introspection; copied from the shared template.
+    # Session-scoped: current consumers only read from it, so one copy
+    # for the whole run is safe
+    return copy.copy(_GATEWAY_CONFIG_TEMPLATE)
@@ -1,33 +1,40 @@
 """Tests for configuration management."""
 import pytest
 from pathlib import Path
-from config_manager import GatewayConfig, TypesConfig, ConfigurationError, load_configuration
+from config_manager import GatewayConfig, TypesConfig, ConfigurationError
 
 
-def test_gateway_config_loads_successfully():
+# Keep the file-loading tests on one xdist worker (pytest -n auto
+# --dist loadgroup) so the session-scoped config fixtures are built once
+pytestmark = pytest.mark.xdist_group("config_io")
+
+
+def test_gateway_config_loads_successfully(real_gateway_config):
     """Test that gateway configuration loads without errors."""
-    config = GatewayConfig("config/gateway_config.json")
+    config = real_gateway_config
     assert config.domain_id >= 0
     assert config.gateway_name == "mcp-dds-gateway"
 
 
-def test_gateway_config_domain_id():
-    """Test domain ID accessor."""
-    config = GatewayConfig("config/gateway_config.json")
-    assert isinstance(config.domain_id, int)
-    assert config.domain_id == 0
-
+@pytest.mark.parametrize("attr,check", [
+    ("domain_id", lambda v: isinstance(v, int) and v == 0),
+    ("security_enabled", lambda v: isinstance(v, bool)),
+    ("certs_base_path", lambda v: isinstance(v, Path)),
+    ("rate_limiting_enabled", lambda v: isinstance(v, bool)),
+    ("requests_per_minute", lambda v: v > 0),
+    ("per_agent_limit", lambda v: v > 0),
+    ("metrics_enabled", lambda v: isinstance(v, bool)),
+    ("metrics_port", lambda v: v > 0),
+    ("log_level", lambda v: v in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]),
+])
+def test_gateway_config_accessor(real_gateway_config, attr, check):
+    """Test simple gateway configuration accessors."""
+    assert check(getattr(real_gateway_config, attr))
 
-def test_gateway_config_security_settings():
-    """Test security configuration accessors."""
-    config = GatewayConfig("config/gateway_config.json")
-    assert isinstance(config.security_enabled, bool)
-    assert isinstance(config.certs_base_path, Path)
 
-
-def test_gateway_config_agent_permissions():
+def test_gateway_config_agent_permissions(real_gateway_config):
     """Test agent permission checks."""
-    config = GatewayConfig("config/gateway_config.json")
+    config = real_gateway_config
 
     # Test monitoring_agent read permissions
     assert config.can_agent_read_topic("monitoring_agent", "SensorData")
@@ -41,54 +48,35 @@ def test_gateway_config_agent_permissions():
     assert config.can_agent_read_topic("control_agent", "SensorData")
 
 
-def test_gateway_config_get_all_agents():
-    """Test getting all configured agents."""
-    config = GatewayConfig("config/gateway_config.json")
-    agents = config.get_all_agents()
-
-    assert "monitoring_agent" in agents
-    assert "control_agent" in agents
-    assert "query_agent" in agents
-
-
-def test_gateway_config_get_all_topics():
-    """Test getting all topics from configuration."""
-    config = GatewayConfig("config/gateway_config.json")
-    topics = config.get_all_topics()
-
-    assert "SensorData" in topics
-    assert "SystemHealth" in topics
-    assert "CommandTopic" in topics
-    assert "StatusTopic" in topics
-
-
-def test_gateway_config_rate_limiting():
-    """Test rate limiting configuration."""
-    config = GatewayConfig("config/gateway_config.json")
+def test_gateway_config_agents_and_topics(real_gateway_config):
+    """Test agent and topic enumeration from configuration."""
+    config = real_gateway_config
 
-    assert isinstance(config.rate_limiting_enabled, bool)
-    assert config.requests_per_minute > 0
-    assert config.per_agent_limit > 0
+    assert {"monitoring_agent", "control_agent", "query_agent"} <= set(
+        config.get_all_agents()
+    )
+    assert {"SensorData", "SystemHealth", "CommandTopic", "StatusTopic"} <= set(
+        config.get_all_topics()
+    )
 
+    # Monitoring agent should have read topics but no write topics
+    assert len(config.get_agent_read_topics("monitoring_agent")) > 0
+    assert len(config.get_agent_write_topics("monitoring_agent")) == 0
 
-def test_gateway_config_metrics():
-    """Test metrics configuration."""
-    config = GatewayConfig("config/gateway_config.json")
-
-    assert isinstance(config.metrics_enabled, bool)
-    assert config.metrics_port > 0
-    assert config.log_level in ["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"]
+    # Control agent should have both read and write topics
+    assert len(config.get_agent_read_topics("control_agent")) > 0
+    assert len(config.get_agent_write_topics("control_agent")) > 0
 
 
-def test_types_config_loads_successfully():
+def test_types_config_loads_successfully(real_types_config):
     """Test that types configuration loads without errors."""
-    types = TypesConfig("config/types.xml")
+    types = real_types_config
     assert types.types is not None
 
 
-def test_types_config_get_type_definition():
+def test_types_config_get_type_definition(real_types_config):
     """Test retrieving type definitions."""
-    types = TypesConfig("config/types.xml")
+    types = real_types_config
 
     sensor_data = types.get_type_definition("SensorData")
     assert sensor_data is not None
@@ -99,9 +87,9 @@ def test_types_config_get_type_definition():
     assert system_health["@name"] == "SystemHealth"
 
 
-def test_types_config_get_all_type_names():
+def test_types_config_get_all_type_names(real_types_config):
     """Test getting all type names."""
-    types = TypesConfig("config/types.xml")
+    types = real_types_config
     type_names = types.get_all_type_names()
 
     assert "SensorData" in type_names
@@ -111,9 +99,9 @@ def test_types_config_get_all_type_names():
     assert "AlertTopic" in type_names
 
 
-def test_types_config_validate_topic_types():
+def test_types_config_validate_topic_types(real_types_config):
     """Test topic type validation."""
-    types = TypesConfig("config/types.xml")
+    types = real_types_config
 
     # Valid topics
     valid_topics = {"SensorData", "SystemHealth", "CommandTopic"}
@@ -125,9 +113,9 @@ def test_types_config_validate_topic_types():
         types.validate_topic_types(invalid_topics)
 
 
-def test_load_configuration_integration():
+def test_load_configuration_integration(loaded_configs):
     """Test loading and cross-validating all configurations."""
-    gateway_config, types_config = load_configuration()
+    gateway_config, types_config = loaded_configs
 
     # Verify configs are loaded
     assert gateway_config is not None
@@ -155,30 +143,12 @@ def test_types_config_invalid_file():
         TypesConfig("nonexistent.xml")
 
 
-def test_gateway_config_qos_profile():
+def test_gateway_config_qos_profile(real_gateway_config):
     """Test DDS QoS profile retrieval."""
-    config = GatewayConfig("config/gateway_config.json")
+    config = real_gateway_config
     qos = config.get_dds_qos_profile()
 
     assert "reliability" in qos
     assert "durability" in qos
     assert "history_kind" in qos
 
-
-def test_agent_read_write_topics():
-    """Test getting agent-specific topic lists."""
-    config = GatewayConfig("config/gateway_config.json")
-
-    # Monitoring agent should have read topics but no write topics
-    monitoring_read = config.get_agent_read_topics("monitoring_agent")
-    monitoring_write = config.get_agent_write_topics("monitoring_agent")
-
-    assert len(monitoring_read) > 0
-    assert len(monitoring_write) == 0
-
-    # Control agent should have both read and write topics
-    control_read = config.get_agent_read_topics("control_agent")
-    control_write = config.get_agent_write_topics("control_agent")
-
-    assert len(control_read) > 0
-    assert len(control_write) > 0
@@ -1,33 +1,36 @@
 """Tests for DDS Manager."""
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from config_manager import GatewayConfig, TypesConfig
-from dds_manager import DDSManager, DDSManagerError
+from unittest.mock import Mock
 
+# dds_manager is imported lazily inside fixtures and tests; its import
+# chain (DDS bindings fallback, metrics) shouldn't run at collection time
 
-@pytest.fixture
-def mock_dds():
-    """Mock RTI DDS module."""
-    with patch('dds_manager.RTI_AVAILABLE', True):
-        with patch('dds_manager.dds') as mock:
-            yield mock
 
+@pytest.fixture(scope="module")
+def mock_dds(module_mocker):
+    """Run dds_manager as if Cyclone DDS were installed."""
+    # pytest-mock undoes the patch via a single module-level finalizer,
+    # with no context manager to enter and exit ourselves
+    module_mocker.patch('dds_manager.CYCLONE_AVAILABLE', True)
 
-@pytest.fixture
-def dds_manager(gateway_config, mock_dds):
+
+@pytest.fixture(scope="module")
+def dds_manager(gateway_config, real_types_config, mock_dds):
     """Create DDS manager for testing."""
-    types_config = TypesConfig("config/types.xml")
-    manager = DDSManager(gateway_config, types_config)
+    from dds_manager import DDSManager
+
+    manager = DDSManager(gateway_config, real_types_config)
     return manager
 
 
-def test_dds_manager_initialization(gateway_config, mock_dds):
+def test_dds_manager_initialization(gateway_config, real_types_config, mock_dds):
     """Test DDS manager initialization."""
-    types_config = TypesConfig("config/types.xml")
-    manager = DDSManager(gateway_config, types_config)
+    from dds_manager import DDSManager
+
+    manager = DDSManager(gateway_config, real_types_config)
 
     assert manager.gateway_config == gateway_config
-    assert manager.types_config == types_config
+    assert manager.types_config == real_types_config
     assert not manager.is_running
 
 
@@ -4,58 +4,55 @@ from prometheus_client import CollectorRegistry
 from metrics_collector import MetricsCollector
 
 
-@pytest.fixture
-def metrics():
-    """Create metrics collector for testing."""
-    # Use a separate registry for each test to avoid duplicate timeseries errors
-    registry = CollectorRegistry()
-    return MetricsCollector(registry=registry)
-
-
-def test_metrics_collector_initialization(metrics):
+@pytest.fixture(scope="module")
+def populated_metrics():
+    """Create a metrics collector, record once, and cache the exposition text."""
+    # Every test below only asserts substrings of the rendered output, so
+    # record all the sample data up front and render a single snapshot
+    # instead of re-generating the text per test
+    collector = MetricsCollector(registry=CollectorRegistry(), metrics_cache_ttl=0)
+    collector.record_request("subscribe", "test_agent", 0.05, "success")
+    collector.record_dds_sample("SensorData", "read", 10)
+    collector.record_error("subscribe", "TimeoutError")
+    collector.record_permission_denied("test_agent", "SensorData", "read")
+    collector.set_active_agents(5)
+    return collector, collector.get_metrics_text()
+
+
+def test_metrics_collector_initialization(populated_metrics):
     """Test metrics collector initialization."""
-    assert metrics is not None
-    assert metrics.registry is not None
+    collector, _ = populated_metrics
+    assert collector is not None
+    assert collector.registry is not None
 
 
-def test_record_request(metrics):
+def test_record_request(populated_metrics):
     """Test recording a request."""
-    metrics.record_request("subscribe", "test_agent", 0.05, "success")
-
-    # Get metrics text
-    metrics_text = metrics.get_metrics_text()
+    _, metrics_text = populated_metrics
     assert "mcp_requests_total" in metrics_text
     assert "test_agent" in metrics_text
 
 
-def test_record_dds_sample(metrics):
+def test_record_dds_sample(populated_metrics):
     """Test recording DDS samples."""
-    metrics.record_dds_sample("SensorData", "read", 10)
-
-    metrics_text = metrics.get_metrics_text()
+    _, metrics_text = populated_metrics
     assert "dds_samples_total" in metrics_text
     assert "SensorData" in metrics_text
 
 
-def test_record_error(metrics):
+def test_record_error(populated_metrics):
     """Test recording errors."""
-    metrics.record_error("subscribe", "TimeoutError")
-
-    metrics_text = metrics.get_metrics_text()
+    _, metrics_text = populated_metrics
     assert "errors_total" in metrics_text
 
 
-def test_record_permission_denied(metrics):
+def test_record_permission_denied(populated_metrics):
     """Test recording permission denied."""
-    metrics.record_permission_denied("test_agent", "SensorData", "read")
-
-    metrics_text = metrics.get_metrics_text()
+    _, metrics_text = populated_metrics
     assert "permission_denied_total" in metrics_text
 
 
-def test_set_active_agents(metrics):
+def test_set_active_agents(populated_metrics):
     """Test setting active agents gauge."""
-    metrics.set_active_agents(5)
-
-    metrics_text = metrics.get_metrics_text()
+    _, metrics_text = populated_metrics
     assert "active_agents" in metrics_text